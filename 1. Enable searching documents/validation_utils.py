@@ -2,10 +2,13 @@
 import sys
 from pathlib import Path
 
-# Add project root to Python path to import env_validator
-PROJECT_ROOT = Path(__file__).parent.parent.absolute()
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+# Add project root to Python path to import env_validator. Skipped once
+# env_validator is already loaded, so repeated imports neither re-resolve
+# the path nor grow the finder list.
+if "env_validator" not in sys.modules:
+    PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
 
 from env_validator import validate_environment as _validate_environment
 
